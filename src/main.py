@@ -1,17 +1,24 @@
+import atexit
+import bisect
 import json
+import math
 import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from datetime import datetime
 from collections import defaultdict
 
-#Matplotlib
-import matplotlib
-matplotlib.use("TkAgg")
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+#orjson is optional; it is much faster than the stdlib json for big budget files
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DATA_FILE = "budget_data.json"
+#journal entries written between full rewrites of DATA_FILE
+JOURNAL_COMPACT_EVERY = 1000
 DEFAULT_CATEGORIES = {
     "Food": 300.0,
     "Transport": 150.0,
@@ -21,29 +28,107 @@ DEFAULT_CATEGORIES = {
 }
 
 
+def _lazy_mpl():
+    """Import Matplotlib on first use so the model loads without paying for it."""
+    import matplotlib
+    matplotlib.use("TkAgg")
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    return Figure, FigureCanvasTkAgg
+
+
+def _json_dumps(data, indent=True):
+    """Serialize data to UTF-8 JSON bytes, indented unless indent is False."""
+    if orjson is not None:
+        out = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+        #orjson writes NaN/Infinity as null; our data never holds a real null, so
+        #re-encode with the stdlib json, which keeps them readable by _json_loads
+        if b"null" not in out:
+            return out
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def _json_loads(raw):
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            #orjson rejects NaN/Infinity, which files written by the stdlib json may contain
+            pass
+    return json.loads(raw)
+
+
+def _finite(value, what):
+    """Convert value to float, rejecting NaN and infinities (JSON cannot round-trip them)."""
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"{what} must be a finite number.")
+    return value
+
+
 # Model: data handling
 class BudgetModel:
     def __init__(self, data_file=DATA_FILE):
         self.data_file = data_file
+        #changes since the last full save are appended here, one JSON object per line
+        self.journal_file = os.path.splitext(data_file)[0] + ".jsonl"
         self.categories = {}   # name -> { "limit": float }
         self.expenses = []     # list of { "category","amount","desc","date" }
+        self._totals = {}                  # category -> spent, kept in sync with expenses
+        self._by_cat = defaultdict(list)   # category -> its expenses, in insertion order
+        self._cat_keys_lower = {}          # lowercased name -> name, for duplicate checks
+        self._sorted_names = []            # category names, kept sorted for the dropdowns
+        self._journal = None
+        self._journal_ops = 0  # entries appended since the last full save
+        self._seq = 0          # sequence number of the last change applied
+        self._saved_seq = 0    # seq of the newest snapshot known to be on disk (set by the writer)
+        #all disk writes happen on a background thread, in the order they were queued
+        self._save_q = queue.Queue()
+        self._save_error = None
+        self._closed = False
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
         self.load()
+        #the writer is a daemon thread, so drain it before the interpreter exits
+        atexit.register(self.close)
 
     def load(self):
-        if os.path.exists(self.data_file):
+        self._seq = 0
+        self._journal_ops = 0
+        if os.path.exists(self.data_file) or os.path.exists(self.journal_file):
             try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                #tolerate older formats
-                cats = data.get("categories", [])
-                if isinstance(cats, dict):
-                    #maybe saved as dict name->limit
-                    self.categories = {k: {"limit": float(v)} for k, v in cats.items()}
+                if os.path.exists(self.data_file):
+                    with open(self.data_file, "rb") as f:
+                        data = _json_loads(f.read())
+                    #tolerate older formats
+                    cats = data.get("categories", [])
+                    if isinstance(cats, dict):
+                        #maybe saved as dict name->limit
+                        self.categories = {k: {"limit": float(v)} for k, v in cats.items()}
+                    else:
+                        self.categories = {c["name"]: {"limit": float(c["limit"])} for c in cats}
+                    self.expenses = data.get("expenses", [])
+                    self._seq = int(data.get("seq", 0))
                 else:
-                    self.categories = {c["name"]: {"limit": float(c["limit"])} for c in cats}
-                self.expenses = data.get("expenses", [])
+                    #the first snapshot never reached the disk; the journal starts from the defaults
+                    self.categories = {name: {"limit": float(limit)} for name, limit in DEFAULT_CATEGORIES.items()}
+                    self.expenses = []
+                self._saved_seq = self._seq if os.path.exists(self.data_file) else -1
+                damaged = self._replay_journal()
+                #normalize once here so aggregates and views never re-cast or re-format
+                for e in self.expenses:
+                    e["amount"] = float(e["amount"])
+                    e["_display_date"] = e.get("date", "")[:19].replace("T", " ")
+                self._rebuild_indexes()
+                #rewrite a torn journal only now, so the queued snapshot's expense
+                #dicts are no longer being changed by this thread
+                if damaged:
+                    self.save()
             except Exception:
-                #fallback to defaults if file corrupt
+                #fallback to defaults if file corrupt, keeping the unreadable files for recovery
+                for path in (self.data_file, self.journal_file):
+                    if os.path.exists(path):
+                        os.replace(path, path + ".corrupt")
                 self._load_defaults()
         else:
             self._load_defaults()
@@ -51,69 +136,214 @@ class BudgetModel:
     def _load_defaults(self):
         self.categories = {name: {"limit": float(limit)} for name, limit in DEFAULT_CATEGORIES.items()}
         self.expenses = []
+        self._rebuild_indexes()
+        self._saved_seq = -1
         self.save()
 
-    def save(self):
+    def _replay_journal(self):
+        """Apply journal entries newer than the snapshot; return True if a line was torn."""
+        if not os.path.exists(self.journal_file):
+            return False
+        with open(self.journal_file, "rb") as f:
+            lines = f.read().splitlines()
+        damaged = False
+        for line in lines:
+            try:
+                entry = _json_loads(line)
+            except ValueError:
+                #partial line from an interrupted write
+                damaged = True
+                continue
+            #entries already folded into the snapshot are skipped
+            if entry["seq"] <= self._seq:
+                continue
+            self._apply(entry)
+            self._seq = entry["seq"]
+            self._journal_ops += 1
+        return damaged
+
+    def _apply(self, entry):
+        if entry["op"] == "expense":
+            self.expenses.append(entry["expense"])
+        else:
+            #"category" and "limit" entries both set a category's limit
+            self.categories[entry["name"]] = {"limit": float(entry["limit"])}
+
+    def _log(self, entry):
+        self._seq += 1
+        entry["seq"] = self._seq
+        self._save_q.put(("journal", _json_dumps(entry, indent=False) + b"\n"))
+        self._journal_ops += 1
+        if self._journal_ops >= JOURNAL_COMPACT_EVERY:
+            self.save()
+
+    def _writer_loop(self):
+        while True:
+            batch = [self._save_q.get()]
+            while True:
+                try:
+                    batch.append(self._save_q.get_nowait())
+                except queue.Empty:
+                    break
+            #the newest snapshot supersedes every write queued before it; if it
+            #fails, perform those earlier writes after all so no journal line is lost
+            last = max((i for i, (kind, _) in enumerate(batch) if kind == "snapshot"), default=None)
+            if last is None:
+                pending = batch
+            elif self._perform(*batch[last]):
+                pending = batch[last + 1:]
+            else:
+                pending = batch[:last] + batch[last + 1:]
+            for kind, payload in pending:
+                self._perform(kind, payload)
+            synced = [payload for kind, payload in batch if kind == "sync"]
+            for event in synced:
+                event.set()
+            if any(kind == "stop" for kind, _ in batch):
+                return
+
+    def _perform(self, kind, payload):
+        """Carry out one queued write on the writer thread; return False if it failed."""
         try:
-            data = {
-                #store categories as list of objects for readability
-                "categories": [{"name": name, "limit": info["limit"]} for name, info in self.categories.items()],
-                "expenses": self.expenses
-            }
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            if kind == "journal":
+                if self._journal is None:
+                    self._journal = open(self.journal_file, "ab", buffering=0)
+                self._journal.write(payload)
+            elif kind == "snapshot":
+                self._write_snapshot(payload)
+                self._saved_seq = payload["seq"]
+            elif kind == "clear":
+                self._close_journal()
+                for path in (self.data_file, self.journal_file):
+                    if os.path.exists(path):
+                        os.remove(path)
+            elif kind == "stop":
+                self._close_journal()
         except Exception as e:
-            messagebox.showwarning("Save Error", f"Could not save data: {e}")
+            self._save_error = e
+            return False
+        return True
+
+    def _write_snapshot(self, data):
+        #underscore keys are in-memory caches and are not persisted
+        data["expenses"] = [{k: v for k, v in e.items() if not k.startswith("_")} for e in data["expenses"]]
+        #write a temp file and swap it in so a crash never leaves a half-written snapshot
+        tmp = self.data_file + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_json_dumps(data))
+        os.replace(tmp, self.data_file)
+        self._close_journal()
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def flush(self):
+        """Block until every queued write has reached the disk."""
+        if not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._save_q.put(("sync", done))
+        done.wait()
+
+    def take_save_error(self):
+        """Return and clear the last error hit by the background writer, if any."""
+        err, self._save_error = self._save_error, None
+        return err
+
+    def _rebuild_indexes(self):
+        self._cat_keys_lower = {k.lower(): k for k in self.categories}
+        self._sorted_names = sorted(self.categories)
+        #seeded from categories so every category has an entry, spent or not
+        self._totals = {c: 0.0 for c in self.categories}
+        self._by_cat = defaultdict(list)
+        for e in self.expenses:
+            self._totals[e["category"]] = self._totals.get(e["category"], 0.0) + e["amount"]
+            self._by_cat[e["category"]].append(e)
+
+    def save(self):
+        """Queue a full snapshot; it also discards the journal it supersedes."""
+        data = {
+            #store categories as list of objects for readability
+            "categories": [{"name": name, "limit": info["limit"]} for name, info in self.categories.items()],
+            "expenses": list(self.expenses),
+            "seq": self._seq
+        }
+        self._journal_ops = 0
+        self._save_q.put(("snapshot", data))
 
     def add_category(self, name, limit):
         key = name.strip()
         if not key:
             raise ValueError("Category name cannot be empty.")
         #case-insensitive duplicate prevention
-        for existing in list(self.categories.keys()):
-            if existing.lower() == key.lower():
-                raise ValueError(f"Category '{existing}' already exists (case-insensitive match).")
-        self.categories[key] = {"limit": float(limit)}
-        self.save()
+        existing = self._cat_keys_lower.get(key.lower())
+        if existing is not None:
+            raise ValueError(f"Category '{existing}' already exists (case-insensitive match).")
+        limit = _finite(limit, "Limit")
+        self.categories[key] = {"limit": limit}
+        self._cat_keys_lower[key.lower()] = key
+        self._totals[key] = 0.0
+        bisect.insort(self._sorted_names, key)
+        self._log({"op": "category", "name": key, "limit": limit})
 
     def edit_limit(self, name, new_limit):
         if name not in self.categories:
             raise ValueError("Category not found.")
-        self.categories[name]["limit"] = float(new_limit)
-        self.save()
+        new_limit = _finite(new_limit, "Limit")
+        self.categories[name]["limit"] = new_limit
+        self._log({"op": "limit", "name": name, "limit": new_limit})
 
     def add_expense(self, category, amount, desc=""):
         if category not in self.categories:
             raise ValueError("Category does not exist.")
-        e = {"category": category, "amount": float(amount), "desc": desc, "date": datetime.now().isoformat()}
+        amount = _finite(amount, "Amount")
+        now = datetime.now()
+        record = {"category": category, "amount": amount, "desc": desc, "date": now.isoformat()}
+        #the in-memory copy carries the display cache; only record is journaled
+        e = dict(record, _display_date=now.strftime("%Y-%m-%d %H:%M:%S"))
         self.expenses.append(e)
-        self.save()
+        self._totals[category] += e["amount"]
+        self._by_cat[category].append(e)
+        self._log({"op": "expense", "expense": record})
 
     def get_spent_per_category(self):
-        totals = defaultdict(float)
-        for e in self.expenses:
-            totals[e["category"]] += float(e["amount"])
-        #ensure all categories present
-        for c in self.categories.keys():
-            totals.setdefault(c, 0.0)
-        return dict(totals)
+        return dict(self._totals)
 
     def get_category_summary(self, category):
-        spent = sum(float(e["amount"]) for e in self.expenses if e["category"] == category)
+        spent = self._totals.get(category, 0.0)
         limit = float(self.categories.get(category, {}).get("limit", 0.0))
         remaining = limit - spent
         return {"spent": spent, "limit": limit, "remaining": remaining}
 
+    def category_names(self):
+        """Category names in sorted order (shared list; do not modify)."""
+        return self._sorted_names
+
     def get_expenses_for_category(self, category):
-        return [e for e in self.expenses if e["category"] == category]
+        return list(self._by_cat.get(category, ()))
 
     def clear_all(self):
-        if os.path.exists(self.data_file):
-            try:
-                os.remove(self.data_file)
-            except Exception:
-                pass
+        self._save_q.put(("clear", None))
+        self._seq = 0
         self._load_defaults()
+        self.flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        #fold outstanding journal entries into the snapshot, retrying one that failed earlier
+        self.flush()
+        if self._saved_seq != self._seq:
+            self.save()
+        #stop the writer once everything queued so far is on disk
+        self._save_q.put(("stop", None))
+        self._writer.join()
+        atexit.unregister(self.close)
 
 
 
@@ -123,10 +353,13 @@ class SmartBudgetGUI:
         self.root = root
         self.root.title("SmartBudget")
         self.model = BudgetModel()
+        self._refresh_pending = None  # Tk after() id of a scheduled refresh
+        self._last_names_tuple = None  # category names last pushed to the comboboxes
 
         self.build_ui()
         self.populate_category_widgets()
         self.refresh_all()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def build_ui(self):
         # Top frame: add category / add expense
@@ -166,12 +399,30 @@ class SmartBudgetGUI:
         middle.pack(fill="both", expand=True, padx=8, pady=6)
 
         # Matplotlib figure
+        Figure, FigureCanvasTkAgg = _lazy_mpl()
         self.fig = Figure(figsize=(8, 3.6), tight_layout=True)
         self.ax_left = self.fig.add_subplot(1, 2, 1)
         self.ax_right = self.fig.add_subplot(1, 2, 2)
         self.canvas = FigureCanvasTkAgg(self.fig, master=middle)
         self.canvas.get_tk_widget().pack(side="left", fill="both", expand=True)
 
+        # Pie artists are kept between refreshes and mutated in place; they are
+        # only rebuilt when the slice layout changes (see update_*_chart)
+        self._left_layout = None
+        self._left_wedges = []
+        self._left_legend = None
+        self._left_legend_texts = []
+        self._right_layout = None
+        self._right_wedges = []
+        self._right_texts = []
+        self._right_autotexts = []
+        self._bg = None
+        self._full_draw_pending = False
+        # what each chart last rendered, so identical refreshes can be skipped
+        self._last_fingerprint_left = None
+        self._last_fingerprint_right = None
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+
         # Right panel: selector, summary, listbox
         right = tk.Frame(middle)
         right.pack(side="left", fill="y", padx=6)
@@ -260,35 +511,73 @@ class SmartBudgetGUI:
             messagebox.showinfo("Reset", "Data reset to defaults.")
 
     
+    def on_close(self):
+        self.model.close()
+        self.root.destroy()
+
+    
     # UI helpers
     def populate_category_widgets(self):
-        names = sorted(self.model.categories.keys())
-        self.combo_cat["values"] = names
-        self.select_combo["values"] = names
+        names = tuple(self.model.category_names())
+        if names == self._last_names_tuple:
+            return
+        self._last_names_tuple = names
+        self.combo_cat.configure(values=names)
+        self.select_combo.configure(values=names)
         # set defaults if nothing selected
         if names:
-            if not self.combo_cat.get() or self.combo_cat.get() not in names:
-                self.combo_cat.set(names[0])
-            if not self.select_combo.get() or self.select_combo.get() not in names:
-                self.select_combo.set(names[0])
+            for combo in (self.combo_cat, self.select_combo):
+                current = combo.get()
+                if not current or current not in names:
+                    combo.set(names[0])
 
     def refresh_all(self):
+        # coalesce bursts of updates into a single redraw of the final state
+        if self._refresh_pending:
+            return
+        self._refresh_pending = self.root.after(50, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = None
+        err = self.model.take_save_error()
+        if err is not None:
+            messagebox.showwarning("Save Error", f"Could not save data: {err}")
         self.populate_category_widgets()
         self.update_spending_chart()
         self.update_category_chart()
 
     def update_spending_chart(self):
-        self.ax_left.clear()
         totals = self.model.get_spent_per_category()
 
         # Sort: highest first
         items = sorted(totals.items(), key=lambda x: -x[1])
+        fingerprint = tuple(items)
+        if fingerprint == self._last_fingerprint_left:
+            return
+        self._last_fingerprint_left = fingerprint
         labels = [name for name, _ in items]
         sizes = [amt for _, amt in items]
+        legend_labels = [f"{name}: ${amt:.2f}" for name, amt in items]
+
+        layout = len(sizes) if sum(sizes) > 0 else None
+        if layout == self._left_layout and layout is not None:
+            # same number of slices: move the existing wedges and relabel the legend
+            self._update_pie(self._left_wedges, sizes)
+            for txt, lbl in zip(self._left_legend_texts, legend_labels):
+                if txt.get_text() != lbl:
+                    txt.set_text(lbl)
+            self._blit()
+            return
 
-        if sum(sizes) == 0:
+        self._left_layout = layout
+        self._left_wedges = []
+        self._left_legend = None
+        self._left_legend_texts = []
+        self.ax_left.clear()
+
+        if layout is None:
             self.ax_left.text(0.5, 0.5, "No spending recorded", ha="center", va="center")
-            self.canvas.draw_idle()
+            self._redraw()
             return
 
         # Clean pie chart with no overlapping labels
@@ -298,47 +587,138 @@ class SmartBudgetGUI:
         )
 
         # Add legend on the left side (no overlap possible)
-        legend_labels = [f"{name}: ${amt:.2f}" for name, amt in items]
-        self.ax_left.legend(
+        self._left_legend = self.ax_left.legend(
             wedges,
             legend_labels,
             title="Categories",
             loc="center left",
             bbox_to_anchor=(1.05, 0.5)
         )
+        self._left_wedges = list(wedges)
+        self._left_legend_texts = list(self._left_legend.get_texts())
+        for artist in self._left_wedges + [self._left_legend]:
+            artist.set_animated(True)
 
         self.ax_left.set_title("Spending per Category")
-        self.canvas.draw_idle()
+        self._redraw()
 
 
     def update_category_chart(self):
-        self.ax_right.clear()
         cat = self.select_combo.get()
         if not cat or cat not in self.model.categories:
+            self._last_fingerprint_right = None
+            self._reset_right_chart(None)
             self.ax_right.text(0.5, 0.5, "No category selected", ha="center", va="center")
-            self.canvas.draw_idle()
+            self._redraw()
             self.update_summary_box(None)
             self.update_tx_list(None)
             return
         summary = self.model.get_category_summary(cat)
-        spent = summary["spent"]
-        limit = summary["limit"]
+        # only the pie is skipped when unchanged; the summary and transactions always refresh
+        fingerprint = (cat, summary["spent"], summary["limit"])
+        if fingerprint != self._last_fingerprint_right:
+            self._last_fingerprint_right = fingerprint
+            self._draw_category_pie(cat, summary["spent"], summary["limit"])
+        self.update_summary_box(cat)
+        self.update_tx_list(cat)
+
+    def _draw_category_pie(self, cat, spent, limit):
         remaining = max(limit - spent, 0.0)
         if limit <= 0:
             # only show spent slice
-            if spent <= 0:
-                self.ax_right.text(0.5, 0.5, "No data for this category", ha="center", va="center")
-            else:
-                self.ax_right.pie([spent], labels=[f"Spent\n${spent:.2f}"], startangle=90)
+            mode = "spent" if spent > 0 else "empty"
+            sizes = [spent]
+            labels = [f"Spent\n${spent:.2f}"]
+            explode = None
         else:
+            mode = "split"
             sizes = [spent, remaining]
             labels = [f"Spent\n${spent:.2f}", f"Remaining\n${remaining:.2f}"]
             explode = (0.05, 0)
-            self.ax_right.pie(sizes, labels=labels, autopct="%1.1f%%", startangle=90, explode=explode)
-        self.ax_right.set_title(f"Spent vs Remaining: {cat}")
+
+        if (cat, mode) == self._right_layout and mode != "empty":
+            self._update_pie(self._right_wedges, sizes, labels, self._right_texts,
+                             self._right_autotexts, explode)
+            self._blit()
+        else:
+            self._reset_right_chart((cat, mode))
+            if mode == "empty":
+                self.ax_right.text(0.5, 0.5, "No data for this category", ha="center", va="center")
+            elif mode == "spent":
+                wedges, texts = self.ax_right.pie(sizes, labels=labels, startangle=90)
+                self._right_wedges, self._right_texts = list(wedges), list(texts)
+            else:
+                wedges, texts, autotexts = self.ax_right.pie(sizes, labels=labels, autopct="%1.1f%%", startangle=90, explode=explode)
+                self._right_wedges, self._right_texts = list(wedges), list(texts)
+                self._right_autotexts = list(autotexts)
+            for artist in self._right_wedges + self._right_texts + self._right_autotexts:
+                artist.set_animated(True)
+            self.ax_right.set_title(f"Spent vs Remaining: {cat}")
+            self._redraw()
+
+    def _reset_right_chart(self, layout):
+        self._right_layout = layout
+        self._right_wedges = []
+        self._right_texts = []
+        self._right_autotexts = []
+        self.ax_right.clear()
+
+    def _update_pie(self, wedges, sizes, labels=None, texts=(), autotexts=(), explode=None):
+        """Move existing pie wedges (and their label/percent texts) to new sizes.
+
+        Mirrors the geometry Axes.pie uses with startangle=90, radius 1,
+        labeldistance 1.1 and pctdistance 0.6.
+        """
+        # numpy ships with matplotlib; imported here so the model stays light
+        import numpy as np
+        sizes = np.asarray(sizes, dtype=float)
+        cum = np.concatenate(([0.0], np.cumsum(sizes)))
+        theta = 90.0 + 360.0 * cum / cum[-1]
+        mid = np.radians((theta[:-1] + theta[1:]) / 2)
+        cos, sin = np.cos(mid), np.sin(mid)
+        offset = np.asarray(explode if explode else np.zeros(len(sizes)), dtype=float)
+        x, y = offset * cos, offset * sin
+        pcts = 100.0 * sizes / cum[-1]
+        for i, wedge in enumerate(wedges):
+            wedge.set_center((x[i], y[i]))
+            wedge.set_theta1(theta[i])
+            wedge.set_theta2(theta[i + 1])
+            if i < len(texts):
+                xt = x[i] + 1.1 * cos[i]
+                texts[i].set_position((xt, y[i] + 1.1 * sin[i]))
+                texts[i].set_horizontalalignment("left" if xt > 0 else "right")
+                texts[i].set_text(labels[i])
+            if i < len(autotexts):
+                autotexts[i].set_position((x[i] + 0.6 * cos[i], y[i] + 0.6 * sin[i]))
+                autotexts[i].set_text(f"{pcts[i]:.1f}%")
+
+    def _animated_artists(self):
+        artists = self._left_wedges + self._right_wedges + self._right_texts + self._right_autotexts
+        if self._left_legend is not None:
+            artists.append(self._left_legend)
+        return artists
+
+    def _on_canvas_draw(self, event):
+        # full draws skip animated artists: grab the static background, then paint them on top
+        self._full_draw_pending = False
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._animated_artists():
+            self.fig.draw_artist(artist)
+
+    def _redraw(self):
+        self._full_draw_pending = True
         self.canvas.draw_idle()
-        self.update_summary_box(cat)
-        self.update_tx_list(cat)
+
+    def _blit(self):
+        if self._full_draw_pending:
+            return  # the scheduled full draw will pick up the new state
+        if self._bg is None:
+            self._redraw()
+            return
+        self.canvas.restore_region(self._bg)
+        for artist in self._animated_artists():
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
 
     def update_summary_box(self, cat):
         self.summary_box.config(state="normal")
@@ -359,17 +739,18 @@ class SmartBudgetGUI:
         self.summary_box.config(state="disabled")
 
     def update_tx_list(self, cat):
-        self.tx_list.delete(0, tk.END)
         if cat and cat in self.model.categories:
             exps = self.model.get_expenses_for_category(cat)
-            for e in exps:
-                dt = e.get("date", "")[:19].replace("T", " ")
-                self.tx_list.insert(tk.END, f"{dt} | ${float(e['amount']):.2f} | {e.get('desc','')}")
+            rows = [f"{e['_display_date']} | ${e['amount']:.2f} | {e.get('desc','')}"
+                    for e in exps]
         else:
             # show recent global
-            for e in list(reversed(self.model.expenses[-100:])):
-                dt = e.get("date", "")[:19].replace("T", " ")
-                self.tx_list.insert(tk.END, f"{dt} | {e['category']} | ${float(e['amount']):.2f} | {e.get('desc','')}")
+            rows = [f"{e['_display_date']} | {e['category']} | ${e['amount']:.2f} | {e.get('desc','')}"
+                    for e in reversed(self.model.expenses[-100:])]
+        # one Tcl call for all rows instead of one per row
+        self.tx_list.delete(0, tk.END)
+        if rows:
+            self.tx_list.insert(tk.END, *rows)
 
 
 if __name__ == "__main__":